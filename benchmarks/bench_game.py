@@ -0,0 +1,219 @@
+"""
+Reproducible benchmarks for the Skyward Dash game loop.
+
+Runs the real SkywardDashGame logic and renderer under the SDL dummy video and audio
+drivers for a set of seeded scenarios, reports throughput, frame-time percentiles and
+memory, and compares the throughput against benchmarks/baseline.json:
+
+    python benchmarks/bench_game.py                     # run everything, flag regressions
+    python benchmarks/bench_game.py -s stress-300       # a single scenario
+    python benchmarks/bench_game.py --update-baseline   # record this machine's numbers
+    python benchmarks/bench_game.py --render-scale 0.5  # at half render resolution
+
+Exits with status 1 when a scenario is slower than its baseline by more than --tolerance.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # asset paths are relative to the repository root
+
+import pygame
+from skyward_dash import entities
+from skyward_dash.game import SkywardDashGame
+from skyward_dash.simulate import heuristic_policy
+
+BASELINE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+
+SCENARIOS = {
+    'play-level1': {'kind': 'play', 'speed': 1, 'frames': 3000},
+    'play-level2': {'kind': 'play', 'speed': 2, 'frames': 3000},
+    'play-level3': {'kind': 'play', 'speed': 3, 'frames': 3000},
+    'play-level1-full-redraw': {'kind': 'play', 'speed': 1, 'frames': 3000, 'dirty_rendering': False},
+    'stress-300': {'kind': 'stress', 'obstacles': 300, 'missiles': 300, 'frames': 600},
+    'stress-300-entity-store': {'kind': 'stress', 'obstacles': 300, 'missiles': 300, 'frames': 600, 'entity_store': True},
+    'menus': {'kind': 'menus', 'frames': 1000},
+    'menus-cached': {'kind': 'menus', 'frames': 1000, 'cached': True},
+}
+
+
+def play_frames(game, scenario, seed):
+    """
+    One tick plus one rendered frame per call, with the heuristic policy at the controls.
+    A crashed or finished run restarts with the next seed so every frame is gameplay.
+    """
+    policy_rng = random.Random(seed)
+    state = {'seed': seed}
+
+    def restart():
+        game.start_run(scenario['speed'], state['seed'])
+        game.draw_background()
+        state['seed'] += 1
+
+    restart()
+
+    def frame(i):
+        if heuristic_policy(game, policy_rng):
+            game.bird.jump()
+        if not game.update_world(game.step_ms) or game.score_keeper.score >= game.LEVEL_UP_SCORE:
+            restart()
+        game.draw_frame()
+
+    return frame
+
+
+def stress_frames(game, scenario, seed):
+    """
+    Keeps hundreds of obstacles and missiles on screen; the bird's crashes are ignored.
+    """
+    game.start_run(1, seed)
+    game.draw_background()
+    rng = random.Random(seed)
+
+    def counts():
+        if game.entities is not None:
+            kinds = game.entities.kind[:len(game.entities)]
+            return int((kinds == entities.OBSTACLE).sum()), int((kinds == entities.MISSILE).sum())
+        return len(game.obstacles), len(game.missiles)
+
+    def top_up(spread):
+        obstacles, missiles = counts()
+        for _ in range(scenario['obstacles'] - obstacles):
+            x = rng.randint(0, game.SCREEN_WIDTH) if spread else game.SCREEN_WIDTH + rng.randint(0, 100)
+            y = rng.randint(game.GAP_SIZE, game.SCREEN_HEIGHT - game.GAP_SIZE)
+            game.spawn_obstacle(x, y, rng.random() < 0.5)
+        for _ in range(scenario['missiles'] - missiles):
+            x = rng.randint(0, game.SCREEN_WIDTH) if spread else game.SCREEN_WIDTH + rng.randint(0, 100)
+            game.spawn_missile(x, rng.randint(0, game.SCREEN_HEIGHT - game.MISSILE_HEIGHT))
+
+    top_up(True)
+
+    def frame(i):
+        game.update_world(game.step_ms)
+        top_up(False)
+        game.draw_frame()
+
+    return frame
+
+
+def menu_frames(game, scenario, seed):
+    game.start_run(1, seed)
+    game.score_keeper.score = 1234
+    game_over = game.GameOverScreen(game, game.score_keeper)
+    menus = [game.draw_intro, game.draw_instructions, game.draw_level_up, game_over.draw]
+    game.menu_frame = None
+
+    def frame(i):
+        if scenario.get('cached'):
+            # what an idle menu costs on a repaint: blit of the composed frame and a flip
+            game.show_menu('intro', game.draw_intro)
+        else:
+            menus[i % len(menus)]()
+            pygame.display.flip()
+
+    return frame
+
+
+FRAME_BUILDERS = {'play': play_frames, 'stress': stress_frames, 'menus': menu_frames}
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def run_scenario(game, name, scenario, seed, scale):
+    frames = max(1, int(scenario['frames'] * scale))
+    game.dirty_rendering = scenario.get('dirty_rendering', True)
+    game.use_entity_store = scenario.get('entity_store', False)
+    build = FRAME_BUILDERS[scenario['kind']]
+
+    # timing pass
+    frame = build(game, scenario, seed)
+    times = []
+    for i in range(frames):
+        start = time.perf_counter()
+        frame(i)
+        times.append(time.perf_counter() - start)
+
+    # memory pass, shorter since tracing slows everything down
+    frame = build(game, scenario, seed)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for i in range(max(1, frames // 5)):
+        frame(i)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    growth = after.compare_to(before, 'filename')
+
+    game.end_run()
+    return {
+        'frames': frames,
+        'ticks_per_sec': round(frames / sum(times), 1),
+        'p50_ms': round(percentile(times, 0.5) * 1000, 3),
+        'p95_ms': round(percentile(times, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(times, 0.99) * 1000, 3),
+        'alloc_blocks': sum(stat.count_diff for stat in growth),
+        'alloc_kib': round(sum(stat.size_diff for stat in growth) / 1024, 1),
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the Skyward Dash game loop.')
+    parser.add_argument('-s', '--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='scenario to run, may be repeated (default: all)')
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--scale', type=float, default=1.0, help='multiply the frame count of every scenario')
+    parser.add_argument('--tolerance', type=float, default=0.15,
+                        help='allowed throughput drop against the baseline, as a fraction')
+    parser.add_argument('--update-baseline', action='store_true', help='store these results as the new baseline')
+    parser.add_argument('--output', help='also write the results to this JSON file')
+    parser.add_argument('--render-scale', type=float, default=1,
+                        help='render resolution relative to 800x600; results are stored as NAME@SCALEx')
+    args = parser.parse_args()
+
+    game = SkywardDashGame(scores_path=None, render_scale=args.render_scale)
+    names = args.scenario or list(SCENARIOS)
+    suffix = f'@{args.render_scale:g}x' if args.render_scale != 1 else ''
+    results = {name + suffix: run_scenario(game, name, SCENARIOS[name], args.seed, args.scale) for name in names}
+
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE) as f:
+            baseline = json.load(f)
+
+    regressions = []
+    print(f"{'scenario':<30}{'ticks/s':>10}{'base':>10}{'p50 ms':>9}{'p99 ms':>9}{'allocs':>8}{'peak KiB':>10}")
+    for name, result in results.items():
+        base = baseline.get(name, {}).get('ticks_per_sec')
+        flag = ''
+        if base and result['ticks_per_sec'] < base * (1 - args.tolerance):
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f"{name:<30}{result['ticks_per_sec']:>10}{base or '-':>10}{result['p50_ms']:>9}{result['p99_ms']:>9}"
+              f"{result['alloc_blocks']:>8}{result['peak_kib']:>10}{flag}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.update_baseline:
+        baseline.update(results)
+        with open(BASELINE, 'w') as f:
+            json.dump(baseline, f, indent=2)
+            f.write('\n')
+    return 1 if regressions and not args.update_baseline else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,17 @@
+"""
+Skyward Dash, a side-scrolling arcade game built on pygame.
+
+    python -m skyward_dash [--render-scale 0.5] [--startup-report]
+
+Importing the package does not import pygame; skyward_dash.game does, and even a
+SkywardDashGame only sets up its display, mixer, fonts and assets once they are used.
+"""
+
+__all__ = ['SkywardDashGame', 'main']
+
+
+def __getattr__(name): #SkywardDashGame and main, imported on first use
+    if name in __all__:
+        from . import game
+        return getattr(game, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
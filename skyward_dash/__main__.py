@@ -0,0 +1,5 @@
+import sys
+
+from .game import main
+
+sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Pre-baked asset bundle.
+
+Baking decodes and scales every image once, converts it to the 32-bit pixel format
+displays use, and writes the raw pixels into one file. At startup the game memory-maps
+that file and builds its surfaces straight on top of the mapped pages, so nothing is
+decoded or scaled and processes on one host share the same pages. A window still copies
+the opaque images into its own alpha-less format, which blits faster.
+
+File layout: magic, version, header length and data offset, a JSON header, then the
+pixel data (BGRA, 4 bytes per pixel, each image 16-byte aligned). The header records the image
+specs and the size and mtime of every source file; when any of that no longer matches,
+the bundle is stale and the game falls back to the source files.
+
+    python -m skyward_dash.bundle   # bake img/assets.bundle
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b'SKDB'
+BUNDLE_VERSION = 1
+PREFIX = struct.Struct('<4sHII')
+ALIGN = 16
+
+
+def bundle_key(game_cls):
+    """
+    Everything the baked pixels depend on; a bundle is only used when its key matches.
+    """
+    specs = {name: [path, list(size)] for name, (path, size) in game_cls.IMAGE_FILES.items()}
+    specs['small_bird_image'] = ['img/bird.png', [game_cls.SMALL_BIRD_WIDTH, game_cls.SMALL_BIRD_HEIGHT]]
+    specs['loading_image'] = [game_cls.LOADING_IMAGE, [game_cls.SCREEN_WIDTH, game_cls.SCREEN_HEIGHT]]
+    sources = {}
+    for path, _ in specs.values():
+        stat = os.stat(path)
+        sources[path] = [stat.st_size, stat.st_mtime_ns]
+    return {'version': BUNDLE_VERSION, 'images': specs, 'sources': sources}
+
+
+def load(path, game_cls):
+    """
+    Maps a bundle and returns {name: surface} built on the mapped pixels,
+    or None when the bundle is missing, unreadable or stale.
+    """
+    import pygame
+
+    try:
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, header_size, data_start = PREFIX.unpack_from(data)
+        if magic != MAGIC or version != BUNDLE_VERSION:
+            return None
+        header = json.loads(bytes(data[PREFIX.size:PREFIX.size + header_size]))
+        if header['key'] != bundle_key(game_cls):
+            return None
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+
+    pixels = memoryview(data)
+    surfaces = {}
+    for name, entry in header['entries'].items():
+        width, height = entry['size']
+        start = data_start + entry['offset']
+        surface = pygame.image.frombuffer(pixels[start:start + width * height * 4], (width, height), 'BGRA')
+        if not entry['alpha']:
+            surface.set_alpha(None)  # opaque images blit without blending
+        if entry['colorkey'] is not None:
+            surface.set_colorkey(entry['colorkey'], pygame.RLEACCEL)
+        surfaces[name] = surface
+    return surfaces
+
+
+def bake(path, game_cls):
+    """
+    Decodes, scales and converts every image through the game's own loading code
+    and writes the bundle to path.
+    """
+    import pygame
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))  # convert() needs a display
+
+    game = game_cls(headless=True, asset_bundle=None)
+    images = {name: getattr(game, name) for name in list(game_cls.IMAGE_FILES) + ['small_bird_image']}
+    images['loading_image'] = game.load_loading_image()
+
+    entries = {}
+    blobs = []
+    offset = 0
+    for name, image in images.items():
+        alpha = bool(image.get_flags() & pygame.SRCALPHA)
+        image = image.convert_alpha() if alpha else image.convert()
+        blob = pygame.image.tobytes(image, 'BGRA')
+        colorkey = image.get_colorkey()
+        entries[name] = {'offset': offset, 'size': list(image.get_size()), 'alpha': alpha,
+                         'colorkey': list(colorkey) if colorkey else None}
+        blobs.append(blob)
+        offset += len(blob)
+        offset += -offset % ALIGN
+        blobs.append(bytes(-len(blob) % ALIGN))
+
+    header = json.dumps({'key': bundle_key(game_cls), 'entries': entries}).encode()
+    data_start = PREFIX.size + len(header)
+    data_start += -data_start % ALIGN
+
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(PREFIX.pack(MAGIC, BUNDLE_VERSION, len(header), data_start))
+        f.write(header)
+        f.write(bytes(data_start - PREFIX.size - len(header)))
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, path)
+    return entries
+
+
+def main():
+    from .game import SkywardDashGame
+
+    path = sys.argv[1] if len(sys.argv) > 1 else SkywardDashGame.ASSET_BUNDLE
+    entries = bake(path, SkywardDashGame)
+    print(f'baked {len(entries)} images into {path} ({os.path.getsize(path) // 1024} KiB)')
+
+
+if __name__ == '__main__':
+    main()
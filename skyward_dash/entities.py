@@ -0,0 +1,98 @@
+"""
+Struct-of-arrays store for the entities that only scroll left: obstacles, power-ups and missiles.
+
+Positions, sizes, velocities and kinds live in NumPy arrays, so moving, culling and
+overlap tests against the bird are a handful of vectorized operations per tick instead
+of one Python update() call per sprite. The arrays are kept in spawn order.
+"""
+import numpy as np
+
+OBSTACLE = 0
+POWERUP = 1
+MISSILE = 2
+
+FIELDS = ('x', 'prev_x', 'y', 'w', 'h', 'vx', 'kind', 'gap_y')
+
+
+class EntityStore:
+    def __init__(self, capacity=64):
+        self.count = 0
+        for name in FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.int8 if name == 'kind' else np.int32))
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, kind, x, y, w, h, vx, gap_y=0):
+        if self.count == len(self.x):
+            for name in FIELDS:
+                array = getattr(self, name)
+                setattr(self, name, np.concatenate([array, np.zeros_like(array)]))
+        i = self.count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = y
+        self.w[i] = w
+        self.h[i] = h
+        self.vx[i] = vx
+        self.kind[i] = kind
+        self.gap_y[i] = gap_y
+        self.count += 1
+        return i
+
+    def step(self):
+        """
+        Moves every entity by its velocity and drops the ones that left the screen.
+        """
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.x[:n] += self.vx[:n]
+        self.keep(self.x[:n] + self.w[:n] >= 0)
+
+    def keep(self, alive):
+        if alive.all():
+            return
+        n = int(alive.sum())
+        for name in FIELDS:
+            array = getattr(self, name)
+            array[:n] = array[:self.count][alive]
+        self.count = n
+
+    def remove(self, index):
+        alive = np.ones(self.count, dtype=bool)
+        alive[index] = False
+        self.keep(alive)
+
+    def rects(self, kind):
+        """
+        (x, y, w, h) arrays of every entity of one kind, in spawn order.
+        """
+        n = self.count
+        selected = self.kind[:n] == kind
+        return self.x[:n][selected], self.y[:n][selected], self.w[:n][selected], self.h[:n][selected]
+
+    def first(self, kind, min_right):
+        """
+        Index of the first entity of one kind, in spawn order, whose right edge is past
+        min_right, or None.
+        """
+        n = self.count
+        found = np.flatnonzero((self.kind[:n] == kind) & (self.x[:n] + self.w[:n] > min_right))
+        return int(found[0]) if len(found) else None
+
+    def overlapping(self, rect, kind):
+        """
+        Indices, in spawn order, of the entities of one kind whose box overlaps rect.
+        """
+        n = self.count
+        x, y, w, h = self.x[:n], self.y[:n], self.w[:n], self.h[:n]
+        hits = ((self.kind[:n] == kind) & (x < rect.right) & (x + w > rect.left)
+                & (y < rect.bottom) & (y + h > rect.top))
+        return np.flatnonzero(hits)
+
+    def blit_list(self, images, alpha=1.0):
+        """
+        (image, position) pairs for Surface.blits, placed alpha of the way through the last tick.
+        """
+        n = self.count
+        x = np.rint(self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha).astype(np.int32)
+        return list(zip((images[kind] for kind in self.kind[:n].tolist()), zip(x.tolist(), self.y[:n].tolist())))
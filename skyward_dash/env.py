@@ -0,0 +1,111 @@
+"""
+Reinforcement-learning environments over the headless Skyward Dash simulation.
+
+SkywardDashEnv follows the Gymnasium API (reset returns (observation, info), step returns
+(observation, reward, terminated, truncated, info)) without depending on Gymnasium.
+Observations are either a small state vector or the rendered frame as a zero-copy
+pygame.surfarray view. VectorEnv steps a batch of environments in one call.
+
+Actions: 0 does nothing, 1 jumps.
+"""
+import numpy as np
+import pygame
+
+from .game import SkywardDashGame
+
+STATE_SIZE = 5  # bird y, bird velocity, distance to the next pillar pair, its gap centre, shrunk
+CRASH_REWARD = -10.0  # every tick survived is worth 1
+
+
+class SkywardDashEnv:
+    def __init__(self, speed_multiplier=1, observation='state', max_ticks=None, entity_store=False, game=None):
+        if observation not in ('state', 'pixels'):
+            raise ValueError("observation must be 'state' or 'pixels'")
+        self.game = game if game is not None else SkywardDashGame(headless=True, entity_store=entity_store)
+        self.speed_multiplier = speed_multiplier
+        self.observation = observation
+        self.max_ticks = max_ticks
+        if observation == 'pixels':
+            self.canvas = pygame.Surface((self.game.SCREEN_WIDTH, self.game.SCREEN_HEIGHT))
+            self.pixels = None
+
+    def reset(self, seed=None):
+        state = self.game.reset(seed, self.speed_multiplier)
+        return self.observe(), state
+
+    def step(self, action):
+        state, done = self.game.step(action)
+        reward = CRASH_REWARD if state['crashed'] else 1.0
+        truncated = not done and self.max_ticks is not None and state['tick'] >= self.max_ticks
+        return self.observe(), reward, done, truncated, state
+
+    def observe(self):
+        if self.observation == 'pixels':
+            return self.observe_pixels()
+        return self.observe_state()
+
+    def observe_state(self):
+        game = self.game
+        gap = game.next_gap()
+        distance, gap_y = gap if gap else (game.SCREEN_WIDTH, game.SCREEN_HEIGHT // 2)
+        return np.array([
+            game.bird.rect.centery / game.SCREEN_HEIGHT,
+            game.bird.velocity / game.JUMP_STRENGTH,
+            distance / game.SCREEN_WIDTH,
+            gap_y / game.SCREEN_HEIGHT,
+            float(game.bird.shrunk),
+        ], dtype=np.float32)
+
+    def observe_pixels(self):
+        """
+        A (width, height, 3) uint8 view straight into the rendered frame, no copy made.
+        The view locks the canvas; if the caller still holds the previous one, the next
+        frame is drawn on a fresh canvas so that view stays intact.
+        """
+        self.pixels = None
+        if self.canvas.get_locked():
+            self.canvas = pygame.Surface(self.canvas.get_size())
+        self.game.draw_scene(self.canvas)
+        self.pixels = pygame.surfarray.pixels3d(self.canvas)
+        return self.pixels
+
+
+class VectorEnv:
+    """
+    num_envs independent environments sharing one set of loaded assets, stepped together.
+    Finished environments are reset on the spot; their last observation is in
+    infos['final_observation']. Observations are written into one preallocated batch
+    array that the next reset or step overwrites, copy it to keep it.
+    """
+
+    def __init__(self, num_envs, **kwargs):
+        template = SkywardDashEnv(**kwargs)
+        self.envs = [template] + [SkywardDashEnv(game=template.game.clone(), **kwargs) for _ in range(num_envs - 1)]
+        self.num_envs = num_envs
+        self.next_seed = None
+        if template.observation == 'pixels':
+            shape, dtype = (template.game.SCREEN_WIDTH, template.game.SCREEN_HEIGHT, 3), np.uint8
+        else:
+            shape, dtype = (STATE_SIZE,), np.float32
+        self.observations = np.zeros((num_envs,) + shape, dtype=dtype)
+
+    def reset(self, seed=None):
+        for i, env in enumerate(self.envs):
+            self.observations[i] = env.reset(None if seed is None else seed + i)[0]
+        self.next_seed = None if seed is None else seed + self.num_envs
+        return self.observations, {}
+
+    def step(self, actions):
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        terminated = np.zeros(self.num_envs, dtype=bool)
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        final_observations = [None] * self.num_envs
+        for i, (env, action) in enumerate(zip(self.envs, actions)):
+            observation, rewards[i], terminated[i], truncated[i], _ = env.step(action)
+            if terminated[i] or truncated[i]:
+                final_observations[i] = np.array(observation)
+                observation = env.reset(self.next_seed)[0]
+                if self.next_seed is not None:
+                    self.next_seed += 1
+            self.observations[i] = observation
+        return self.observations, rewards, terminated, truncated, {'final_observation': final_observations}
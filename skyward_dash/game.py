@@ -0,0 +1,1256 @@
+import argparse
+import pygame
+import random
+import sqlite3
+import sys
+import threading
+import time
+import json
+import csv
+import os
+import copy
+import pygame.mixer
+from collections import OrderedDict, deque
+from . import bundle, level, scores
+from .replay import Replay
+
+try:
+    from . import entities
+except ImportError:  # numpy is only needed for the entity store
+    entities = None
+
+class SkywardDashGame:
+    # Constants
+    BIRD_HEIGHT = 70
+    BIRD_WIDTH = 120
+    SMALL_BIRD_HEIGHT = 50
+    SMALL_BIRD_WIDTH = 90
+    OBSTACLE_WIDTH = 140
+    OBSTACLE_HEIGHT = 300
+    GAP_SIZE = 230
+    GRAVITY = 1.0
+    JUMP_STRENGTH = 10
+    SCREEN_HEIGHT = 600
+    SCREEN_WIDTH = 800
+    BLUE = (0, 0, 255)
+    WHITE = (255, 255, 255)
+    SHRINK_DURATION = 5000
+    BUTTON_WIDTH = 200
+    BUTTON_HEIGHT = 50
+    MISSILE_WIDTH = 40
+    MISSILE_HEIGHT = 20
+    SCROLL_SPEED = 5  # pixels per tick that pillars and power-ups move left
+    TICK_RATE = 30
+    FRAME_RATE = 60  # render cap, the simulation runs at TICK_RATE * speed_multiplier
+    MAX_TICKS_PER_FRAME = 5  # on a slow frame, drop time rather than spiral into catch-up
+    LEVEL_UP_SCORE = 1000
+    OBSTACLE_INTERVAL = 1500  # Milliseconds between obstacles at speed 1
+    POWERUP_INTERVAL = 8000  # Milliseconds between power-ups
+    POWERUP_CLEARANCE = 100  # minimum distance between a new power-up and a pillar
+    TEXT_CACHE_SIZE = 128  # rendered text surfaces kept around
+    PROFILE_FRAMES = 600  # frames kept by the profiler's ring buffer
+    MENU_IDLE_TIMEOUT = 500  # longest a menu sleeps in event.wait, in milliseconds
+    LOADING_POLL = 50  # how often the loading screen checks progress, in milliseconds
+
+    # attribute: (file, size) of every image loaded behind the loading screen
+    IMAGE_FILES = {
+        'background_image': ('img/forest.jpg', (SCREEN_WIDTH, SCREEN_HEIGHT)),
+        'background_image_game_over': ('img/gameover.jpg', (SCREEN_WIDTH, SCREEN_HEIGHT)),
+        'powerup_image': ('img/cookie.png', (30, 30)),
+        'bird_image': ('img/bird.png', (BIRD_WIDTH, BIRD_HEIGHT)),
+        'obstacle_image': ('img/pillar.png', (OBSTACLE_WIDTH, OBSTACLE_HEIGHT)),
+    }
+    # long tracks are streamed from disk by pygame.mixer.music, one at a time
+    MUSIC_FILES = {
+        'background_music': 'sound/background_music.ogg',
+        'game_over_music': 'sound/game_over.ogg',
+    }
+    # sound effects are decoded into memory, in priority order, until the budget runs out
+    SOUND_FILES = {
+        'jump_sound': 'sound/jump.ogg',
+        'hit_sound': 'sound/collison.ogg',
+        'collect_sound': 'sound/collect.ogg',
+        'level_up_sound': 'sound/level_up.ogg',
+    }
+    SOUND_MEMORY_BUDGET = 8 * 1024 * 1024  # bytes of decoded PCM for sound effects
+    LOADING_IMAGE = 'img/loading.jpg'
+    SCORES_DB = 'scores.db'
+    ASSET_BUNDLE = 'img/assets.bundle'  # baked by skyward_dash.bundle, used instead of the images while fresh
+    BUNDLE_MASKS = (0xff0000, 0xff00, 0xff)  # pixel layout of the baked images
+
+    # attribute: method that creates it, for everything set up lazily on first access
+    LAZY_ATTRIBUTES = {
+        'screen': 'init_display',
+        'audio': 'init_mixer',
+        'bundle': 'open_bundle',
+        'loading_image': 'init_loading_image',
+        **dict.fromkeys([*IMAGE_FILES, *MUSIC_FILES, *SOUND_FILES, 'small_bird_image', 'missile_image',
+                         'background_image_intro', 'render_images', 'render_background', 'entity_images',
+                         'masks'], 'init_assets'),
+    }
+
+    def __init__(self, headless=False, dirty_rendering=True, profile=False, profile_path=None, replay_dir=None,
+                 entity_store=False, asset_bundle=ASSET_BUNDLE, scores_path=SCORES_DB, render_scale=1):
+        """
+        Only stores the configuration: the display, mixer, fonts, assets and score database
+        are set up the first time something uses them. start() runs the game in a window.
+        """
+        self.created = time.perf_counter()
+        self.startup_times = {}  # subsystem: seconds its setup took, see startup_report
+        # headless mode only loads what the simulation needs: no window, audio or menus
+        self.headless = headless
+        # dirty rendering only repaints the areas that changed, instead of the whole screen
+        self.dirty_rendering = dirty_rendering
+        # frame phase timings, recorded only while a profiler exists (F3 toggles the overlay)
+        self.profiler = self.FrameProfiler(self.PROFILE_FRAMES) if profile else None
+        self.profile_path = profile_path
+        # every finished run is saved here as a replay, when set
+        self.replay_dir = replay_dir
+        self.last_replay = None
+        # keep obstacles, power-ups and missiles in NumPy arrays instead of sprites (needs numpy)
+        self.use_entity_store = entity_store
+        self.entities = None
+        self.rng = random.Random()
+        self.text = self.TextCache(self.TEXT_CACHE_SIZE)
+        self.pool = self.SpritePool(self)
+        self.obstacles = self.powerups = self.missiles = None  # groups of the current run
+        self.menu_frame = None  # (key, composed surface, buttons) of the last menu shown
+        # the display is render_scale times the world's size and pygame.SCALED stretches it to the
+        # window; the simulation, masks and replays always work in world coordinates
+        self.render_scale = render_scale
+        self.world_canvas = None  # full-size surface menus are drawn on before being scaled down
+        self.asset_bundle = asset_bundle
+        # one manager for the game's lifetime; only games with a window keep scores on disk
+        self.high_score_manager = self.HighScoreManager(None if headless else scores_path)
+        if headless:
+            self.screen = None
+
+    def __getattr__(self, name): #only called for attributes that do not exist yet
+        init = self.LAZY_ATTRIBUTES.get(name)
+        if init is None:
+            raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+        getattr(self, init)()
+        return object.__getattribute__(self, name)
+
+    def timed(self, name, started): #records a subsystem's setup time for the startup report
+        self.startup_times[name] = self.startup_times.get(name, 0) + time.perf_counter() - started
+
+    def startup_report(self):
+        lines = [f'{name:<16}{seconds * 1000:9.1f} ms' for name, seconds in self.startup_times.items()]
+        return '\n'.join(['startup'] + lines)
+
+    def init_display(self):
+        started = time.perf_counter()
+        pygame.display.init()
+        if self.render_scale != 1:
+            self.screen = pygame.display.set_mode(self.render_size((self.SCREEN_WIDTH, self.SCREEN_HEIGHT)), pygame.SCALED)
+            self.world_canvas = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT)).convert()
+        else:
+            self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        pygame.display.set_caption('Skyward Dash')
+        self.timed('display', started)
+
+    def init_mixer(self):
+        started = time.perf_counter()
+        self.audio = False
+        if not self.headless:
+            try:
+                pygame.mixer.init()  # Initialize mixer with default values
+                self.audio = True
+            except pygame.error:
+                print("Warning: Audio device may not be available.")
+        self.timed('mixer', started)
+
+    def open_bundle(self):
+        started = time.perf_counter()
+        # memory-mapped surfaces from the asset bundle, None when it is missing or stale
+        self.bundle = bundle.load(self.asset_bundle, type(self)) if self.asset_bundle else None
+        self.timed('bundle', started)
+
+    def init_loading_image(self):
+        self.loading_image = self.load_loading_image().convert()
+
+    def init_assets(self):
+        self.load_assets()
+        self.prepare_assets()
+
+    def start(self):
+        """
+        Opens the window and runs the game, from the loading screen until it is closed.
+        Only the loading screen is set up first, the assets load behind it on a worker thread.
+        """
+        # set up on the main thread, before the loader thread gets to them
+        self.screen
+        self.audio
+        self.bundle
+        self.high_score_manager.open_store()  # the best scores load behind the loading screen
+        if 'masks' in self.__dict__:  # assets were already loaded by an earlier access
+            self.background_music.play(-1)
+            self.run(('intro',))
+            return
+        self.asset_error = None
+        loader = threading.Thread(target=self.load_assets_in_background, daemon=True)
+        loader.start()
+        self.run(('loading', loader))
+
+    def load_assets(self): #loading all the assets
+        """
+        Decodes and scales every image and sound. Safe to run off the main thread:
+        it never touches the display, see prepare_assets for that part.
+        """
+        started = time.perf_counter()
+        self.assets_total = len(self.IMAGE_FILES) + (0 if self.headless else len(self.SOUND_FILES))
+        self.assets_loaded = 0
+        if self.bundle is not None:  # already decoded and scaled, just mapped in
+            for name in list(self.IMAGE_FILES) + ['small_bird_image']:
+                setattr(self, name, self.bundle[name])
+            self.assets_loaded += len(self.IMAGE_FILES)
+        else:
+            for name, (path, size) in self.IMAGE_FILES.items():
+                setattr(self, name, pygame.transform.scale(pygame.image.load(path), size))
+                self.assets_loaded += 1
+            self.small_bird_image = pygame.transform.scale(self.bird_image, (self.SMALL_BIRD_WIDTH, self.SMALL_BIRD_HEIGHT))
+        self.missile_image = pygame.Surface([self.MISSILE_WIDTH, self.MISSILE_HEIGHT])
+        self.missile_image.fill((255, 0, 0))  # Red color
+        self.timed('images', started)
+
+        started = time.perf_counter()
+        self.load_sounds()
+        self.timed('sounds', started)
+
+    def load_loading_image(self):
+        if self.bundle is not None:
+            return self.bundle['loading_image']
+        return pygame.transform.scale(pygame.image.load(self.LOADING_IMAGE), (self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+
+    def load_sounds(self):
+        silent = self.SilentSound()
+        mixer_settings = pygame.mixer.get_init() if not self.headless and self.audio else None
+        if mixer_settings is None:  # headless, or no audio device
+            for name in list(self.MUSIC_FILES) + list(self.SOUND_FILES):
+                setattr(self, name, silent)
+            return
+
+        for name, path in self.MUSIC_FILES.items():
+            setattr(self, name, self.Music(path))
+
+        frequency, sample_format, channels = mixer_settings
+        bytes_per_second = frequency * channels * abs(sample_format) // 8
+        self.sound_memory = 0
+        for name, path in self.SOUND_FILES.items():
+            sound = pygame.mixer.Sound(path)
+            size = int(sound.get_length() * bytes_per_second)
+            if self.sound_memory + size > self.SOUND_MEMORY_BUDGET:
+                print(f"Warning: {path} does not fit in the sound memory budget and is muted.")
+                sound = silent
+            else:
+                self.sound_memory += size
+            setattr(self, name, sound)
+            self.assets_loaded += 1
+
+    def load_assets_in_background(self):
+        try:
+            self.load_assets()
+        except Exception as error:  # handed over to the main thread by loading_screen
+            self.asset_error = error
+
+    def prepare_assets(self):
+        """
+        Main-thread half of asset loading: converts the images to the display's pixel
+        format once a window exists and builds the collision masks.
+        """
+        started = time.perf_counter()
+        if self.screen is not None:
+            # baked alpha images already have the display's pixel format and stay memory-mapped
+            mapped = self.bundle is not None and self.screen.get_masks()[:3] == self.BUNDLE_MASKS
+            for name in list(self.IMAGE_FILES) + ['small_bird_image', 'missile_image']:
+                image = getattr(self, name)
+                if not image.get_flags() & pygame.SRCALPHA:
+                    setattr(self, name, image.convert())  # opaque blits are fastest without an alpha channel
+                elif not mapped:
+                    setattr(self, name, image.convert_alpha())
+        self.background_image_intro = self.background_image
+
+        # what the renderer blits in place of the world images when the render resolution is lower
+        self.render_images = {}
+        if self.screen is not None and self.render_scale != 1:
+            for image in (self.background_image, self.bird_image, self.small_bird_image, self.obstacle_image,
+                          self.powerup_image, self.missile_image):
+                self.render_images[image] = self.scale_for_render(image)
+        self.render_background = self.render_images.get(self.background_image, self.background_image)
+        self.entity_images = (self.obstacle_image, self.powerup_image, self.missile_image)  # by entity kind
+
+        # collision masks are built once per surface and shared by every sprite using it
+        self.masks = {}
+        for image in (self.bird_image, self.small_bird_image, self.obstacle_image, self.missile_image):
+            self.get_mask(image)
+        self.timed('prepare', started)
+
+    def render_size(self, size): #world size to render resolution
+        return (max(1, round(size[0] * self.render_scale)), max(1, round(size[1] * self.render_scale)))
+
+    def scale_for_render(self, image):
+        colorkey = image.get_colorkey()
+        if colorkey is None:
+            return pygame.transform.smoothscale(image, self.render_size(image.get_size()))
+        scaled = pygame.transform.scale(image, self.render_size(image.get_size()))  # no blending into the key
+        scaled.set_colorkey(colorkey, pygame.RLEACCEL)
+        return scaled
+
+    def get_mask(self, surface): #cached collision mask for a surface
+        mask = self.masks.get(surface)
+        if mask is None:
+            mask = pygame.mask.from_surface(surface)
+            self.masks[surface] = mask
+        return mask
+
+    class TextCache: #shared fonts and a bounded LRU cache of rendered text
+        def __init__(self, max_size):
+            self.max_size = max_size
+            self.fonts = {}
+            self.surfaces = OrderedDict()
+            self.digits = {}
+
+        def font(self, size, name=None):
+            font = self.fonts.get((name, size))
+            if font is None:
+                if not pygame.font.get_init():  # fonts are set up on the first text drawn
+                    pygame.font.init()
+                font = pygame.font.Font(name, size)
+                self.fonts[(name, size)] = font
+            return font
+
+        def render(self, text, size, color, antialias=True, name=None):
+            key = (name, size, text, tuple(color), antialias)
+            surface = self.surfaces.get(key)
+            if surface is not None:
+                self.surfaces.move_to_end(key)
+                return surface
+            surface = self.font(size, name).render(text, antialias, color)
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_size:
+                self.surfaces.popitem(last=False)
+            return surface
+
+        def blit_number(self, target, pos, prefix, number, size, color, antialias=True, name=None):
+            """
+            Draws prefix followed by number, composing the number from cached digit glyphs
+            so a changing counter never re-rasterizes the whole string. Returns the drawn area.
+            """
+            key = (name, size, tuple(color), antialias)
+            glyphs = self.digits.get(key)
+            if glyphs is None:
+                font = self.font(size, name)
+                glyphs = [font.render(str(digit), antialias, color) for digit in range(10)]
+                self.digits[key] = glyphs
+            x, y = pos
+            area = target.blit(self.render(prefix, size, color, antialias, name), (x, y))
+            x = area.right
+            for digit in str(number):
+                glyph = glyphs[ord(digit) - 48]
+                target.blit(glyph, (x, y))
+                x += glyph.get_width()
+            area.width = x - area.x
+            return area
+
+    class Music: #a long track streamed by pygame.mixer.music, played like a Sound
+        playing = None  # the track currently loaded into the music stream
+
+        def __init__(self, path):
+            self.path = path
+
+        def play(self, loops=0):
+            pygame.mixer.music.load(self.path)
+            pygame.mixer.music.play(loops)
+            SkywardDashGame.Music.playing = self
+
+        def stop(self):
+            if SkywardDashGame.Music.playing is self:
+                pygame.mixer.music.stop()
+                SkywardDashGame.Music.playing = None
+
+    class FrameProfiler: #per-phase frame timings in a ring buffer, plus an on-screen overlay
+        PHASES = ('events', 'update', 'spawn', 'collision', 'powerups', 'draw', 'flip')
+
+        def __init__(self, size):
+            self.frames = deque(maxlen=size)  # (frame seconds, sprite count, phase seconds...)
+            self.overlay = False
+            self.overlay_surface = None
+            self.frame_count = 0  # frames recorded so far, the ring buffer's length stops growing
+            self.phase_times = dict.fromkeys(self.PHASES, 0.0)
+            self.frame_start = self.last_mark = time.perf_counter()
+
+        def begin_frame(self):
+            for phase in self.PHASES:
+                self.phase_times[phase] = 0.0
+            self.frame_start = self.last_mark = time.perf_counter()
+
+        def mark(self, phase): #charges the time since the last mark to phase
+            now = time.perf_counter()
+            self.phase_times[phase] += now - self.last_mark
+            self.last_mark = now
+
+        def end_frame(self, sprite_count):
+            phases = self.phase_times
+            self.frame_count += 1
+            self.frames.append((self.last_mark - self.frame_start, sprite_count) + tuple(phases[phase] for phase in self.PHASES))
+
+        def percentile(self, column, fraction):
+            values = sorted(frame[column] for frame in self.frames)
+            if not values:
+                return 0.0
+            return values[min(int(len(values) * fraction), len(values) - 1)]
+
+        def draw_overlay(self, game):
+            """
+            Draws p50/p99 frame time and sprite count in the top right corner. The text is
+            re-rendered every 15 frames so the overlay does not thrash the text cache.
+            """
+            if self.overlay_surface is None or self.frame_count % 15 == 0:
+                lines = [
+                    f'frame p50 {self.percentile(0, 0.5) * 1000:.2f} ms',
+                    f'frame p99 {self.percentile(0, 0.99) * 1000:.2f} ms',
+                    f'sprites {self.frames[-1][1] if self.frames else 0}',
+                ]
+                font = game.text.font(24)
+                rendered = [font.render(line, True, game.WHITE, (0, 0, 0)) for line in lines]
+                self.overlay_surface = pygame.Surface((max(line.get_width() for line in rendered), 20 * len(rendered)))
+                for i, line in enumerate(rendered):
+                    self.overlay_surface.blit(line, (0, 20 * i))
+            return game.screen.blit(self.overlay_surface, (game.screen.get_width() - self.overlay_surface.get_width() - 10, 10))
+
+        def export(self, path):
+            """
+            Writes the recorded frames to path, as JSON if it ends in .json and as CSV otherwise.
+            Times are in milliseconds.
+            """
+            columns = ('frame_ms', 'sprites') + tuple(f'{phase}_ms' for phase in self.PHASES)
+            rows = [[round(value * 1000, 4) if i != 1 else value for i, value in enumerate(frame)] for frame in self.frames]
+            with open(path, 'w', newline='') as f:
+                if path.endswith('.json'):
+                    json.dump({
+                        'p50_ms': round(self.percentile(0, 0.5) * 1000, 4),
+                        'p99_ms': round(self.percentile(0, 0.99) * 1000, 4),
+                        'frames': [dict(zip(columns, row)) for row in rows],
+                    }, f, indent=1)
+                else:
+                    writer = csv.writer(f)
+                    writer.writerow(columns)
+                    writer.writerows(rows)
+
+    class SilentSound: #stands in for every sound in headless mode or without an audio device
+        def play(self, *args, **kwargs):
+            pass
+
+        def stop(self):
+            pass
+
+    class Bird(pygame.sprite.Sprite): #bird class
+        def __init__(self, game):
+            super().__init__()
+            self.game = game
+            self.jump_sound = game.jump_sound
+            self.image = game.bird_image
+            self.mask = game.get_mask(self.image)
+            self.rect = self.image.get_rect()
+            self.rect.center = (100, game.SCREEN_HEIGHT // 2)
+            self.prev_pos = self.rect.topleft  # position before the last tick, for interpolation
+            self.velocity = 0
+            self.shrunk = False
+            self.shrink_start_time = 0
+
+        def update(self): #bird movement
+            self.velocity += self.game.GRAVITY
+            self.rect.y += int(self.velocity)
+
+            if self.rect.top < 0:
+                self.rect.top = 0
+                self.velocity = 0
+
+            if self.rect.bottom > self.game.SCREEN_HEIGHT:
+                self.rect.bottom = self.game.SCREEN_HEIGHT
+                self.velocity = 0
+
+            if self.shrunk and self.game.elapsed - self.shrink_start_time > self.game.SHRINK_DURATION:
+                self.reset_size()
+
+        def jump(self):
+            self.velocity = -self.game.JUMP_STRENGTH
+            self.jump_sound.play()
+
+        def shrink(self):
+            self.image = self.game.small_bird_image
+            self.mask = self.game.get_mask(self.image)
+            self.rect = self.image.get_rect(center=self.rect.center)
+            self.shrunk = True
+            self.shrink_start_time = self.game.elapsed
+
+        def reset_size(self):
+            self.image = self.game.bird_image
+            self.mask = self.game.get_mask(self.image)
+            self.rect = self.image.get_rect(center=self.rect.center)
+            self.shrunk = False
+
+    class HighScoreManager: #best score of every level, persisted in a ScoreStore when given a path
+        def __init__(self, path=None):
+            self.path = path
+            self.store = None  # opened on first use
+            self.high_scores = {}  # speed multiplier: best score, without a store
+
+        def open_store(self):
+            if self.store is None and self.path:
+                try:
+                    self.store = scores.ScoreStore(self.path)
+                except (sqlite3.Error, OSError, RuntimeError) as error:  # e.g. no thread could be started
+                    print(f"Warning: high scores are kept in memory only: {error}")
+                    self.path = None
+            return self.store
+
+        def update(self, score, speed_multiplier=1, seed=None):
+            if self.open_store() is not None:
+                self.store.add(score, speed_multiplier, seed)
+            elif score > self.high_scores.get(speed_multiplier, 0):
+                self.high_scores[speed_multiplier] = score
+
+        def get_high_score(self, speed_multiplier=1):
+            if self.open_store() is not None:
+                return self.store.high_score(speed_multiplier)
+            return self.high_scores.get(speed_multiplier, 0)
+
+        def close(self): #waits for queued scores to reach the disk
+            if self.store is not None:
+                self.store.close()
+
+    class SpritePool: #recycles sprites that left the screen instead of allocating new ones
+        def __init__(self, game):
+            self.game = game
+            self.free = {}
+
+        def acquire(self, cls, *args):
+            free = self.free.get(cls)
+            if free:
+                sprite = free.pop()
+                sprite.reset(*args)
+                return sprite
+            return cls(self.game, *args)
+
+        def release(self, sprite):
+            sprite.kill()
+            self.free.setdefault(type(sprite), []).append(sprite)
+
+    class PowerUp(pygame.sprite.Sprite): #powers up class
+
+        def __init__(self, game, x, y):
+            super().__init__()
+            self.game = game
+            self.collect_sound = game.collect_sound
+            self.image = game.powerup_image
+            self.rect = self.image.get_rect()
+            self.reset(x, y)
+
+        def reset(self, x, y):
+            self.rect.x = x
+            self.rect.y = y
+            self.prev_pos = self.rect.topleft
+
+        def activate(self, bird):
+            bird.shrink()
+            self.collect_sound.play()
+
+        def update(self):
+            self.rect.x -= self.game.SCROLL_SPEED
+            if self.rect.right < 0:
+                self.game.pool.release(self)
+
+    class ScoreKeeper: #score keeper class
+        def __init__(self, game, high_score_manager):
+            self.game = game
+            self.score = 0
+            self.high_score_manager = high_score_manager
+
+        def update(self):
+            self.score += 1
+
+        def reset(self):
+            self.high_score_manager.update(self.score, self.game.speed_multiplier, self.game.seed)
+            self.score = 0
+
+        def render(self):
+            scale = self.game.render_scale
+            return self.game.text.blit_number(self.game.screen, (round(10 * scale), round(10 * scale)), 'Score: ',
+                                              self.score, round(36 * scale), self.game.WHITE)
+
+    class Missile(pygame.sprite.Sprite):
+
+        def __init__(self, game, x, y):
+            super().__init__()
+            self.game = game
+            self.image = game.missile_image
+            self.mask = game.get_mask(self.image)
+            self.rect = self.image.get_rect()
+            self.reset(x, y)
+
+        def reset(self, x, y):
+            self.rect.x = x
+            self.rect.y = y
+            self.prev_pos = self.rect.topleft
+
+        def update(self):
+            self.rect.x -= 10
+            if self.rect.x < -self.game.MISSILE_WIDTH:
+                self.game.pool.release(self)
+
+
+    class Obstacle(pygame.sprite.Sprite): #obstacle class
+
+        def __init__(self, game, x, y, is_top):
+            super().__init__()
+            self.game = game
+            self.image = game.obstacle_image
+            self.mask = game.get_mask(self.image)
+            self.rect = self.image.get_rect()
+            self.reset(x, y, is_top)
+
+        def reset(self, x, y, is_top):
+            self.rect.x = x
+            self.gap_y = y  # centre of the gap this pillar belongs to
+            if is_top:
+                self.rect.bottom = y - self.game.GAP_SIZE // 2
+            else:
+                self.rect.top = y + self.game.GAP_SIZE // 2
+            self.prev_pos = self.rect.topleft
+
+        def update(self):
+            self.rect.x -= self.game.SCROLL_SPEED
+            if self.rect.right < 0:
+                self.game.pool.release(self)
+
+    def draw_button(self, text, x, y, width, height):
+        button_rect = pygame.Rect(x, y, width, height)
+        pygame.draw.rect(self.screen, self.BLUE, button_rect)
+        text_surf = self.text.render(text, 36, self.WHITE)
+        text_rect = text_surf.get_rect(center=button_rect.center)
+        self.screen.blit(text_surf, text_rect)
+        return button_rect
+
+    def button_clicked(self, button_rect, event):
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if button_rect.collidepoint(self.to_world(event.pos)):  # buttons are laid out in world coordinates
+                return True
+        return False
+
+    def to_world(self, pos): #display coordinates to world coordinates
+        if self.render_scale == 1:
+            return pos
+        return (int(pos[0] / self.render_scale), int(pos[1] / self.render_scale))
+
+    def run(self, scene):
+        """
+        Top-level scene loop. Every screen returns the next scene as a (name, *args) tuple,
+        or None to quit, instead of calling it, so the stack stays flat and each screen's
+        state is released when it returns, however long the game runs.
+        """
+        scenes = {
+            'loading': self.loading_screen,
+            'intro': self.intro_screen,
+            'instructions': self.instructions_screen,
+            'play': self.game,
+            'level_up': self.level_up_screen,
+            'game_over': self.game_over_screen,
+        }
+        while scene is not None:
+            name, *args = scene
+            scene = scenes[name](*args)
+        if self.profiler is not None and self.profile_path:
+            self.profiler.export(self.profile_path)
+        self.high_score_manager.close()
+        pygame.quit()
+
+    def loading_screen(self, loader):
+        shown = None
+        while loader.is_alive():
+            for event in self.menu_events(self.LOADING_POLL):
+                if event.type == pygame.QUIT:
+                    return None
+
+            progress = getattr(self, 'assets_loaded', 0) / max(getattr(self, 'assets_total', 1), 1)
+            if progress != shown:  # only redraw when the bar moved
+                self.compose(self.draw_loading, progress)
+                pygame.display.flip()
+                shown = progress
+
+        loader.join()
+        if self.asset_error is not None:
+            raise self.asset_error
+        self.prepare_assets()
+
+        self.background_music.play(-1)
+        return ('intro',)
+
+    def show_menu(self, key, draw):
+        """
+        Shows a static menu. The composed frame is kept, so showing the same menu again,
+        e.g. after the window was uncovered, is a single blit. Returns the menu's buttons.
+        """
+        if self.menu_frame is None or self.menu_frame[0] != key:
+            buttons = self.compose(draw)
+            self.menu_frame = (key, self.screen.copy(), buttons)
+        else:
+            self.screen.blit(self.menu_frame[1], (0, 0))
+        pygame.display.flip()
+        if 'first menu' not in self.startup_times:  # time from construction until the game is usable
+            self.startup_times['first menu'] = time.perf_counter() - self.created
+        return self.menu_frame[2]
+
+    def compose(self, draw, *args):
+        """
+        Runs a screen's draw function. Menus are laid out for the full world size, so at a
+        lower render resolution they are drawn on the world canvas and scaled onto the display.
+        """
+        display = self.screen
+        if self.world_canvas is None:
+            return draw(*args)
+        self.screen = self.world_canvas
+        try:
+            result = draw(*args)
+        finally:
+            self.screen = display
+        pygame.transform.smoothscale(self.world_canvas, display.get_size(), display)
+        return result
+
+    def menu_events(self, timeout=None):
+        """
+        Sleeps in pygame.event.wait until input arrives or the timeout passes, instead of
+        spinning, and returns the pending events. Repaints the menu if the window was exposed.
+        """
+        event = pygame.event.wait(timeout or self.MENU_IDLE_TIMEOUT)
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        if self.menu_frame is not None and any(event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED) for event in events):
+            self.screen.blit(self.menu_frame[1], (0, 0))
+            pygame.display.flip()
+        return events
+
+    def draw_loading(self, progress):
+        self.screen.blit(self.loading_image, (0, 0))
+        text = self.text.render('Welcome to Skyward Dash', 48, (255, 255, 255))
+        self.screen.blit(text, (self.SCREEN_WIDTH // 2 - text.get_width() // 2, self.SCREEN_HEIGHT // 2 - text.get_height() // 2))
+
+        # progress bar
+        bar = pygame.Rect(self.SCREEN_WIDTH // 4, self.SCREEN_HEIGHT * 3 // 4, self.SCREEN_WIDTH // 2, 20)
+        pygame.draw.rect(self.screen, self.WHITE, bar, 2)
+        pygame.draw.rect(self.screen, self.WHITE, (bar.x, bar.y, int(bar.width * progress), bar.height))
+
+    def start_run(self, speed_multiplier, seed=None):
+        """
+        Creates a fresh bird, score and sprite groups for one run.
+        All randomness of the run comes from self.rng and time from the tick count, so the seed
+        and the jumps recorded in self.jumps are enough to replay it.
+        """
+        if self.obstacles is not None:
+            self.end_run()
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.jumps = []  # ticks on which the player jumped
+        self.speed_multiplier = speed_multiplier
+        self.step_ms = 1000 / (self.TICK_RATE * speed_multiplier)  # length of one simulation tick
+        self.elapsed = 0  # logical game clock in milliseconds
+        self.tick_count = 0
+        self.crashed = False
+
+        self.bird = self.Bird(self)
+        self.score_keeper = self.ScoreKeeper(self, self.high_score_manager)
+        self.all_sprites = pygame.sprite.Group()
+        self.all_sprites.add(self.bird)
+        self.obstacles = pygame.sprite.Group()
+        self.powerups = pygame.sprite.Group()
+        self.missiles = pygame.sprite.Group()
+        if self.use_entity_store:
+            if entities is None:
+                raise RuntimeError('the entity store needs numpy installed')
+            self.entities = entities.EntityStore()
+        self.powerups_collected = 0
+
+        # the level is generated ahead of time, the loop only spawns what is due
+        self.level = level.LevelGenerator(self, self.rng, speed_multiplier).events()
+        self.next_spawn = next(self.level)
+
+    def end_run(self):
+        """
+        Hands the sprites still on screen back to the pool and drops the run's groups.
+        """
+        for group in (self.obstacles, self.powerups, self.missiles):
+            for sprite in group.sprites():
+                self.pool.release(sprite)
+        self.all_sprites.empty()
+        self.obstacles = self.powerups = self.missiles = None
+        self.entities = None
+        self.bird = self.score_keeper = None
+
+    def update_world(self, dt):
+        """
+        Advances the run by one tick that lasted dt milliseconds.
+        Moves the sprites, spawns obstacles and power-ups and resolves collisions,
+        without drawing anything. Returns False once the bird has crashed.
+        """
+        self.elapsed += dt
+        self.tick_count += 1
+        bird = self.bird
+        profiler = self.profiler
+
+        for sprite in self.all_sprites:
+            sprite.prev_pos = sprite.rect.topleft
+        self.all_sprites.update()
+        if self.entities is not None:
+            self.entities.step()
+        if profiler:
+            profiler.mark('update')
+
+        while self.next_spawn[0] <= self.tick_count:
+            _, kind, y = self.next_spawn
+            if kind == level.OBSTACLE:
+                self.spawn_obstacle(self.SCREEN_WIDTH, y, True)
+                self.spawn_obstacle(self.SCREEN_WIDTH, y, False)
+            else:
+                self.spawn_powerup(self.SCREEN_WIDTH, y)
+            self.next_spawn = next(self.level)
+        if profiler:
+            profiler.mark('spawn')
+
+        # Collision detection (check for pixel-perfect collision)
+        if self.entities is not None:
+            hit = self.check_entity_collision(bird)
+        else:
+            hit = self.check_pixel_collision(bird, self.obstacles)
+        if hit:
+            self.hit_sound.play()
+            self.crashed = True
+        if profiler:
+            profiler.mark('collision')
+
+        if self.entities is not None:
+            touching = self.entities.overlapping(bird.rect, entities.POWERUP)
+            if len(touching):
+                bird.shrink()
+                self.collect_sound.play()
+                self.entities.remove(touching[0])
+                self.powerups_collected += 1
+        else:
+            powerup_collected = pygame.sprite.spritecollideany(bird, self.powerups)
+            if powerup_collected:
+                powerup_collected.activate(bird)
+                self.pool.release(powerup_collected)
+                self.powerups_collected += 1
+        if profiler:
+            profiler.mark('powerups')
+
+        self.score_keeper.update()
+        return not self.crashed
+
+    def spawn_obstacle(self, x, y, is_top):
+        if self.entities is not None:
+            height = self.obstacle_image.get_height()
+            top = y - self.GAP_SIZE // 2 - height if is_top else y + self.GAP_SIZE // 2
+            self.entities.spawn(entities.OBSTACLE, x, top, self.obstacle_image.get_width(), height, -self.SCROLL_SPEED, y)
+            return
+        obstacle = self.pool.acquire(self.Obstacle, x, y, is_top)
+        self.obstacles.add(obstacle)
+        self.all_sprites.add(obstacle)
+
+    def spawn_powerup(self, x, y):
+        if self.entities is not None:
+            self.entities.spawn(entities.POWERUP, x, y, *self.powerup_image.get_size(), -self.SCROLL_SPEED)
+            return
+        powerup = self.pool.acquire(self.PowerUp, x, y)
+        self.powerups.add(powerup)
+        self.all_sprites.add(powerup)
+
+    def spawn_missile(self, x, y):
+        if self.entities is not None:
+            self.entities.spawn(entities.MISSILE, x, y, self.MISSILE_WIDTH, self.MISSILE_HEIGHT, -10)
+            return
+        missile = self.pool.acquire(self.Missile, x, y)
+        self.missiles.add(missile)
+        self.all_sprites.add(missile)
+
+    def entity_count(self): #everything on screen apart from the bird
+        if self.entities is not None:
+            return len(self.all_sprites) - 1 + len(self.entities)
+        return len(self.all_sprites) - 1
+
+    def next_gap(self):
+        """
+        (distance, gap centre) of the nearest pillar pair the bird has not passed yet, or None.
+        """
+        left = self.bird.rect.left
+        if self.entities is not None:
+            i = self.entities.first(entities.OBSTACLE, left)  # spawn order is x order
+            if i is None:
+                return None
+            return int(self.entities.x[i]) - left, int(self.entities.gap_y[i])
+        for obstacle in self.obstacles:
+            if obstacle.rect.right > left:
+                return obstacle.rect.x - left, obstacle.gap_y
+        return None
+
+    def reset(self, seed=None, speed_multiplier=1):
+        """
+        Starts a new headless run and returns its initial state.
+        """
+        self.start_run(speed_multiplier, seed)
+        return self.get_state()
+
+    def step(self, action):
+        """
+        Advances a headless run by exactly one tick. A truthy action makes the bird jump first.
+        Returns (state, done); done is set when the bird crashes or the level is cleared.
+        """
+        if action:
+            self.jump()
+        alive = self.update_world(self.step_ms)
+        done = not alive or self.score_keeper.score >= self.LEVEL_UP_SCORE
+        return self.get_state(), done
+
+    def jump(self): #the player's only input, recorded against the tick it applies to
+        if not self.jumps or self.jumps[-1] != self.tick_count:
+            self.jumps.append(self.tick_count)
+        self.bird.jump()
+
+    def make_replay(self):
+        return Replay(self.seed, self.speed_multiplier, self.jumps, self.score_keeper.score)
+
+    def get_state(self): #snapshot of the run for headless callers
+        return {
+            'tick': self.tick_count,
+            'score': self.score_keeper.score,
+            'bird_y': self.bird.rect.centery,
+            'velocity': self.bird.velocity,
+            'shrunk': self.bird.shrunk,
+            'powerups_collected': self.powerups_collected,
+            'crashed': self.crashed,
+        }
+
+    def game(self, speed_multiplier):
+        self.start_run(speed_multiplier)
+        score_keeper = self.score_keeper
+
+        clock = pygame.time.Clock()
+        running = True
+
+        self.draw_background()
+
+        # fixed timestep: frame time is banked and spent in whole simulation ticks,
+        # so the game runs at the same speed whatever frame rate the machine manages
+        accumulator = 0
+
+        next_scene = ('game_over', score_keeper)
+
+        while running:
+            if self.profiler:
+                self.profiler.begin_frame()
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                    next_scene = None
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_SPACE:
+                        self.jump()
+                    elif event.key == pygame.K_F3:
+                        self.toggle_profiler_overlay()
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED) and self.dirty_rendering:
+                    # the uncovered window is stale outside the dirty rects, repaint all of it
+                    self.draw_background()
+            if self.profiler:
+                self.profiler.mark('events')
+
+            accumulator = min(accumulator + clock.get_time(), self.MAX_TICKS_PER_FRAME * self.step_ms)
+            while accumulator >= self.step_ms:
+                accumulator -= self.step_ms
+                if not self.update_world(self.step_ms):
+                    self.background_music.stop()
+                    running = False
+                    break
+                if score_keeper.score >= self.LEVEL_UP_SCORE:
+                    running = False
+                    next_scene = ('level_up', speed_multiplier)
+                    break
+
+            # draw between the last two simulation states
+            self.draw_frame(accumulator / self.step_ms)
+
+            clock.tick(self.FRAME_RATE)
+            if self.profiler:
+                self.profiler.mark('flip')
+                self.profiler.end_frame(self.entity_count() + 1)
+
+        if next_scene is not None:  # the run finished, rather than the window being closed
+            self.high_score_manager.update(score_keeper.score, speed_multiplier, self.seed)
+            self.last_replay = self.make_replay()
+            if self.replay_dir:
+                os.makedirs(self.replay_dir, exist_ok=True)
+                self.last_replay.save(os.path.join(self.replay_dir, f'{time.strftime("%Y%m%d-%H%M%S")}-{self.seed:016x}.skdr'))
+        self.end_run()
+        return next_scene
+
+    def draw_background(self):
+        # start from a clean background, the dirty renderer only repaints what moves
+        self.screen.blit(self.render_background, (0, 0))
+        pygame.display.flip()
+        self.drawn_rects = []
+
+    def draw_frame(self, alpha=1.0):
+        """
+        Draws the current run, with every sprite placed alpha of the way from its position
+        before the last tick to its current one. A full redraw repaints the whole background
+        and flips; dirty rendering restores the background only under last frame's sprites
+        and score and pushes just those areas and the newly drawn ones to the display.
+        """
+        sprites = self.blit_list(alpha)
+        if self.render_scale != 1:
+            sprites = self.scale_blits(sprites)
+        profiler = self.profiler
+        if not self.dirty_rendering:
+            self.screen.blit(self.render_background, (0, 0))
+            self.screen.blits(sprites, False)
+            self.score_keeper.render()
+            if profiler and profiler.overlay:
+                profiler.draw_overlay(self)
+            if profiler:
+                profiler.mark('draw')
+            pygame.display.flip()
+            return
+
+        for rect in self.drawn_rects:
+            self.screen.blit(self.render_background, rect, rect)
+        drawn = self.screen.blits(sprites)
+        drawn.append(self.score_keeper.render())
+        if profiler and profiler.overlay:
+            drawn.append(profiler.draw_overlay(self))
+        if profiler:
+            profiler.mark('draw')
+        pygame.display.update(self.drawn_rects + drawn)
+        self.drawn_rects = drawn
+
+    def blit_list(self, alpha=1.0): #(image, position) of everything in the run, for Surface.blits
+        sprites = [(sprite.image, self.interpolate(sprite, alpha)) for sprite in self.all_sprites]
+        if self.entities is not None:
+            sprites += self.entities.blit_list(self.entity_images, alpha)
+        return sprites
+
+    def scale_blits(self, sprites): #world blit list to render resolution
+        scale, images = self.render_scale, self.render_images
+        return [(images[image], (round(x * scale), round(y * scale))) for image, (x, y) in sprites]
+
+    def draw_scene(self, surface):
+        """
+        Draws the background and everything in the run onto any surface, without the score
+        or touching the display. Works in headless mode too.
+        """
+        surface.blit(self.background_image, (0, 0))
+        surface.blits(self.blit_list(), False)
+
+    def clone(self):
+        """
+        A new game sharing this one's loaded assets, with no run in progress.
+        Cheap way to get many independent headless simulations.
+        """
+        self.masks  # load the assets here once, rather than in every clone
+        game = copy.copy(self)
+        game.pool = self.SpritePool(game)
+        game.text = self.TextCache(self.TEXT_CACHE_SIZE)
+        game.obstacles = game.powerups = game.missiles = game.entities = None
+        game.bird = game.score_keeper = None
+        game.profiler = None
+        game.menu_frame = None
+        return game
+
+    def toggle_profiler_overlay(self):
+        if self.profiler is None:
+            self.profiler = self.FrameProfiler(self.PROFILE_FRAMES)
+        self.profiler.overlay = not self.profiler.overlay
+
+    @staticmethod
+    def interpolate(sprite, alpha):
+        x, y = sprite.rect.topleft
+        prev_x, prev_y = sprite.prev_pos
+        return (round(prev_x + (x - prev_x) * alpha), round(prev_y + (y - prev_y) * alpha))
+
+    def check_pixel_collision(self, bird, obstacles):
+        """
+        Checks for pixel-perfect collision between the bird and any obstacle.
+        Obstacles whose rect does not overlap the bird are skipped before the mask test.
+        """
+        bird_rect = bird.rect
+        for obstacle in obstacles:
+            rect = obstacle.rect
+            # broad phase: only pillars level with the bird on the x axis can hit it
+            if rect.right <= bird_rect.left or rect.left >= bird_rect.right:
+                continue
+            if not bird_rect.colliderect(rect):
+                continue
+            offset = (rect.x - bird_rect.x, rect.y - bird_rect.y)
+            if bird.mask.overlap(obstacle.mask, offset):
+                return True
+        return False
+
+    def check_entity_collision(self, bird):
+        """
+        check_pixel_collision for the entity store: one vectorized box test against every
+        pillar, then the mask test only for the pillars whose box overlaps the bird.
+        """
+        bird_rect = bird.rect
+        obstacle_mask = self.get_mask(self.obstacle_image)
+        for i in self.entities.overlapping(bird_rect, entities.OBSTACLE).tolist():
+            offset = (int(self.entities.x[i]) - bird_rect.x, int(self.entities.y[i]) - bird_rect.y)
+            if bird.mask.overlap(obstacle_mask, offset):
+                return True
+        return False
+
+    class GameOverScreen: #game over screen class
+        def __init__(self, game, score_keeper):
+            self.game = game
+            self.score_keeper = score_keeper
+
+        def display(self):
+            high_score = self.score_keeper.high_score_manager.get_high_score(self.game.speed_multiplier)
+            key = ('game_over', self.score_keeper.score, high_score)
+            restart_button, back_to_home_button, exit_button = self.game.show_menu(key, self.draw)
+            while True:
+                for event in self.game.menu_events():
+                    if event.type == pygame.QUIT:
+                        return None
+                    if event.type == pygame.MOUSEBUTTONDOWN:
+                        if self.game.button_clicked(restart_button, event):
+                            self.game.background_music.play(-1)
+                            return ('play', 1)
+                        elif self.game.button_clicked(back_to_home_button, event):
+                            self.game.background_music.play(-1)
+                            return ('intro',)
+                        elif self.game.button_clicked(exit_button, event):
+                            return None
+
+        def draw(self):
+            self.game.screen.blit(self.game.background_image_game_over, (0, 0))
+            text = self.game.text.render('Game Over', 36, (255, 255, 255))
+            self.game.screen.blit(text, (self.game.SCREEN_WIDTH // 2 - text.get_width() // 2, self.game.SCREEN_HEIGHT // 4))
+
+            # Display current score and high score
+            score_text = self.game.text.render(f'Score: {self.score_keeper.score}', 36, (255, 255, 255))
+            self.game.screen.blit(score_text, (self.game.SCREEN_WIDTH // 2 - score_text.get_width() // 2, self.game.SCREEN_HEIGHT // 2))
+
+            high_score_text = self.game.text.render(f'High Score: {self.score_keeper.high_score_manager.get_high_score(self.game.speed_multiplier)}', 36, (255, 255, 255))
+            self.game.screen.blit(high_score_text, (self.game.SCREEN_WIDTH // 2 - text.get_width() // 2, self.game.SCREEN_HEIGHT // 3))
+#all the buttons
+            restart_button = self.game.draw_button('Restart', self.game.SCREEN_WIDTH // 2 - self.game.BUTTON_WIDTH // 2, self.game.SCREEN_HEIGHT // 2 - self.game.BUTTON_HEIGHT // 2, self.game.BUTTON_WIDTH, self.game.BUTTON_HEIGHT)
+            back_to_home_button = self.game.draw_button('Back to Home', self.game.SCREEN_WIDTH // 2 - self.game.BUTTON_WIDTH // 2, self.game.SCREEN_HEIGHT // 2 + self.game.BUTTON_HEIGHT, self.game.BUTTON_WIDTH, self.game.BUTTON_HEIGHT)
+            exit_button = self.game.draw_button('Exit', self.game.SCREEN_WIDTH // 2 - self.game.BUTTON_WIDTH // 2, self.game.SCREEN_HEIGHT // 2 + 2.5 * self.game.BUTTON_HEIGHT, self.game.BUTTON_WIDTH, self.game.BUTTON_HEIGHT)
+            return restart_button, back_to_home_button, exit_button
+
+    def game_over_screen(self, score_keeper):
+        self.game_over_music.play()
+
+        game_over_screen = self.GameOverScreen(self, score_keeper)
+        return game_over_screen.display()
+
+    def level_up_screen(self, current_speed_multiplier):
+        self.level_up_sound.play()
+        advance_button, exit_button = self.show_menu('level_up', self.draw_level_up)
+        while True:
+            for event in self.menu_events():
+                if event.type == pygame.QUIT:
+                    return None
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    if self.button_clicked(advance_button, event):
+                        return ('play', current_speed_multiplier + 1)
+                    elif self.button_clicked(exit_button, event):
+                        return None
+
+    def draw_level_up(self):
+        self.screen.fill(self.WHITE)
+        text = self.text.render('Level Up!', 36, (0, 0, 0))
+        self.screen.blit(text, (self.SCREEN_WIDTH // 2 - text.get_width() // 2, self.SCREEN_HEIGHT // 4))
+
+        advance_button = self.draw_button('Advance', self.SCREEN_WIDTH // 2 - self.BUTTON_WIDTH // 2, self.SCREEN_HEIGHT // 2 - self.BUTTON_HEIGHT // 2, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        exit_button = self.draw_button('Exit', self.SCREEN_WIDTH // 2 - self.BUTTON_WIDTH // 2, self.SCREEN_HEIGHT // 2 + self.BUTTON_HEIGHT, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        return advance_button, exit_button
+
+    def instructions_screen(self):
+        back_button = self.show_menu('instructions', self.draw_instructions)
+        while True:
+            for event in self.menu_events():
+                if event.type == pygame.QUIT:
+                    return None
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    if self.button_clicked(back_button, event):
+                        return ('intro',)
+
+    def draw_instructions(self):
+        self.screen.fill(self.WHITE)
+        lines = [
+            "How to Play:",
+            "1. Press SPACE to jump.",
+            "2. Avoid obstacles.",
+            "3. Collect cookie to shrink.",
+            "4. Survive as long as possible to score points.",
+            "5. Keep reaching the score 1000 in order to move to the next level."
+        ]
+        for i, line in enumerate(lines):
+            text = self.text.render(line, 36, (0, 0, 0))
+            self.screen.blit(text, (self.SCREEN_WIDTH // 2 - text.get_width() // 2, self.SCREEN_HEIGHT // 4 + i * 40))
+
+        return self.draw_button('Back', self.SCREEN_WIDTH // 2 - self.BUTTON_WIDTH // 2, self.SCREEN_HEIGHT // 2 + 2 * self.BUTTON_HEIGHT, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+
+    def intro_screen(self):
+        start_button, fast_button, how_to_play_button, exit_button = self.show_menu('intro', self.draw_intro)
+        while True:
+            for event in self.menu_events():
+                if event.type == pygame.QUIT:
+                    return None
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    if self.button_clicked(start_button, event):
+                        return ('play', 1)
+                    elif self.button_clicked(fast_button, event):
+                        return ('play', 2)
+                    elif self.button_clicked(how_to_play_button, event):
+                        return ('instructions',)
+                    elif self.button_clicked(exit_button, event):
+                        return None
+
+    def draw_intro(self):
+        self.screen.blit(self.background_image_intro, (0, 0))
+        text = self.text.render('Skyward Dash', 45, (255, 255, 255))
+        self.screen.blit(text, (self.SCREEN_WIDTH // 2 - text.get_width() // 2, self.SCREEN_HEIGHT // 4))
+
+        start_button = self.draw_button('Start Game', self.SCREEN_WIDTH // 2 - self.BUTTON_WIDTH // 2, self.SCREEN_HEIGHT // 2 - self.BUTTON_HEIGHT // 2, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        fast_button = self.draw_button('Harder Game', self.SCREEN_WIDTH // 2 - self.BUTTON_WIDTH // 2, self.SCREEN_HEIGHT // 2 + self.BUTTON_HEIGHT, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        how_to_play_button = self.draw_button('How to Play', self.SCREEN_WIDTH // 2 - self.BUTTON_WIDTH // 2, self.SCREEN_HEIGHT // 2 + 2.5 * self.BUTTON_HEIGHT, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        exit_button = self.draw_button('Exit', self.SCREEN_WIDTH // 2 - self.BUTTON_WIDTH // 2, self.SCREEN_HEIGHT // 2 + 4 * self.BUTTON_HEIGHT, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        return start_button, fast_button, how_to_play_button, exit_button
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='skyward_dash', description='Play Skyward Dash.')
+    parser.add_argument('--render-scale', type=float, default=1,
+                        help='render resolution relative to 800x600, e.g. 0.5 on slow hardware')
+    parser.add_argument('--full-redraw', action='store_true', help='repaint the whole screen every frame')
+    parser.add_argument('--entity-store', action='store_true', help='keep scrolling entities in NumPy arrays')
+    parser.add_argument('--profile', metavar='PATH', help='record frame timings and write them here on exit')
+    parser.add_argument('--replay-dir', help='save every finished run here as a replay')
+    parser.add_argument('--scores', default=SkywardDashGame.SCORES_DB, help='high score database')
+    parser.add_argument('--no-bundle', action='store_true', help='decode the source images instead of the asset bundle')
+    parser.add_argument('--startup-report', action='store_true', help='print how long each subsystem took to set up')
+    args = parser.parse_args(argv)
+
+    game = SkywardDashGame(dirty_rendering=not args.full_redraw, profile=bool(args.profile), profile_path=args.profile,
+                           replay_dir=args.replay_dir, entity_store=args.entity_store,
+                           asset_bundle=None if args.no_bundle else SkywardDashGame.ASSET_BUNDLE,
+                           scores_path=args.scores, render_scale=args.render_scale)
+    game.start()
+    if args.startup_report:
+        print(game.startup_report())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
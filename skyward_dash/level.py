@@ -0,0 +1,145 @@
+"""
+Ahead-of-time procedural level generation for Skyward Dash.
+
+Instead of rolling pillar gaps and power-up positions on timers inside the game loop,
+a run's layout is produced a chunk of ticks at a time, ahead of the camera, as a stream
+of spawn events (tick, kind, y). The game loop only pops the events that are due.
+
+Every chunk is validated against what the bird can actually do: a gap is only drawn
+from the range of centres the bird can reach from the previous gap, given the ticks it
+has between the two pillars, its rise per tick while flapping ((JUMP_STRENGTH - GRAVITY)
+per tick) and its fall under gravity. Power-ups are placed knowing every pillar around
+them, the ones that spawn after them included.
+"""
+import math
+from collections import deque
+
+OBSTACLE = 'obstacle'
+POWERUP = 'powerup'
+
+CHUNK_PAIRS = 8  # pillar pairs generated per chunk
+
+
+class LevelGenerator:
+    def __init__(self, game, rng, speed_multiplier):
+        self.game = game
+        self.rng = rng
+        step_ms = 1000 / (game.TICK_RATE * speed_multiplier)
+        # spawn intervals in ticks; pillars come faster at higher speeds, power-ups do not
+        self.obstacle_ticks = max(1, round(game.OBSTACLE_INTERVAL // speed_multiplier / step_ms))
+        self.powerup_ticks = max(1, round(game.POWERUP_INTERVAL / step_ms))
+        self.chunk_ticks = self.obstacle_ticks * CHUNK_PAIRS
+        # ticks a pillar spawned before (after) a power-up can still be within POWERUP_CLEARANCE of it
+        speed = game.SCROLL_SPEED
+        self.reach_before = math.ceil((game.OBSTACLE_WIDTH + game.POWERUP_CLEARANCE) / speed)
+        self.reach_after = math.ceil(game.POWERUP_CLEARANCE / speed)
+
+        self.pillars = deque()  # (tick, gap centre) generated so far and still needed
+        self.next_pillar = self.obstacle_ticks
+        self.next_powerup = self.powerup_ticks
+        self.chunk_start = 0
+
+    def events(self):
+        """
+        Endless stream of (tick, kind, y) spawn events in tick order.
+        """
+        while True:
+            yield from self.chunk()
+
+    def chunk(self):
+        """
+        Generates the events of the next chunk_ticks ticks.
+        """
+        start, end = self.chunk_start, self.chunk_start + self.chunk_ticks
+        self.chunk_start = end
+        # power-ups need the pillars that spawn shortly after them too
+        while self.next_pillar < end + self.reach_after:
+            self.pillars.append((self.next_pillar, self.next_gap()))
+            self.next_pillar += self.obstacle_ticks
+
+        events = [(tick, OBSTACLE, gap) for tick, gap in self.pillars if start <= tick < end]
+        while self.next_powerup < end:
+            y = self.powerup_y(self.next_powerup)
+            if y is None:  # nothing free here, try the next tick
+                self.next_powerup += 1
+                continue
+            events.append((self.next_powerup, POWERUP, y))
+            self.next_powerup += self.powerup_ticks
+        events.sort(key=lambda event: event[0])
+
+        # emitted pillars too far behind to matter for the next power-up are dropped, the last
+        # one is kept as the reference for the next gap
+        while (len(self.pillars) > 1 and self.pillars[0][0] < end
+               and self.pillars[0][0] + self.reach_before <= self.next_powerup):
+            self.pillars.popleft()
+        return events
+
+    def next_gap(self):
+        """
+        Draws the centre of the next gap among the ones reachable from the previous gap.
+        """
+        game = self.game
+        low, high = game.GAP_SIZE, game.SCREEN_HEIGHT - game.GAP_SIZE
+        if self.pillars:
+            previous = self.pillars[-1][1]
+            low = max(low, previous - self.max_rise())
+            high = min(high, previous + self.max_fall())
+        return self.rng.randint(low, high)
+
+    def free_ticks(self):
+        """
+        Ticks between leaving one pillar pair and reaching the next, when the bird can move
+        freely. Negative when it overlaps both pairs for a while.
+        """
+        game = self.game
+        overlap = math.ceil((game.OBSTACLE_WIDTH + game.BIRD_WIDTH) / game.SCROLL_SPEED)
+        return self.obstacle_ticks - overlap
+
+    def max_rise(self):
+        game = self.game
+        slack = game.GAP_SIZE - game.BIRD_HEIGHT  # room to move inside a gap
+        ticks = max(self.free_ticks(), 0)
+        return int(slack + (game.JUMP_STRENGTH - game.GRAVITY) * ticks)
+
+    def max_fall(self):
+        game = self.game
+        slack = game.GAP_SIZE - game.BIRD_HEIGHT
+        ticks = max(self.free_ticks(), 0)
+        return int(slack + game.GRAVITY * ticks * (ticks + 1) / 2)
+
+    def powerup_y(self, tick):
+        """
+        Picks a y for a power-up spawning on tick that keeps POWERUP_CLEARANCE away from every
+        pillar in reach, in one pass over the free vertical intervals.
+        Returns None when nothing is free on that tick.
+        """
+        game = self.game
+        clearance = game.POWERUP_CLEARANCE
+        x = game.SCREEN_WIDTH
+        blocked = []
+        for pillar_tick, gap in self.pillars:
+            left = x - game.SCROLL_SPEED * (tick - pillar_tick)
+            if left - clearance < x < left + game.OBSTACLE_WIDTH + clearance:
+                top = gap - game.GAP_SIZE // 2  # bottom edge of the top pillar
+                bottom = gap + game.GAP_SIZE // 2  # top edge of the bottom pillar
+                blocked.append((top - game.OBSTACLE_HEIGHT - clearance, top + clearance))
+                blocked.append((bottom - clearance, bottom + game.OBSTACLE_HEIGHT + clearance))
+        blocked.sort()
+
+        # y values strictly inside a blocked interval are taken, the ends are still free
+        free = []
+        low, high = 0, game.SCREEN_HEIGHT - game.powerup_image.get_height()
+        for top, bottom in blocked:
+            if top >= low:
+                free.append((low, min(top, high)))
+            low = max(low, bottom)
+        free.append((low, high))
+        free = [(start, end) for start, end in free if start <= end]
+        if not free:
+            return None
+
+        pick = self.rng.randrange(sum(end - start + 1 for start, end in free))
+        for start, end in free:
+            if pick <= end - start:
+                return start + pick
+            pick -= end - start + 1
@@ -0,0 +1,141 @@
+"""
+Compact binary replays of Skyward Dash runs, and a headless player for them.
+
+A run is fully determined by its seed, its speed multiplier and the ticks on which
+SPACE was pressed, so that is all a replay stores (little endian):
+
+    4s      magic b'SKDR'
+    B       format version
+    Q       seed
+    B       speed multiplier
+    I       final score
+    I       number of jumps
+    varint  tick of each jump, as the delta from the previous one
+
+    python -m skyward_dash.replay verify replays/*.skdr
+"""
+import argparse
+import struct
+import sys
+import time
+
+MAGIC = b'SKDR'
+REPLAY_VERSION = 2  # 2: levels come from the ahead-of-time generator
+HEADER = struct.Struct('<4sBQBII')
+
+
+class ReplayError(ValueError):
+    pass
+
+
+class Replay:
+    def __init__(self, seed, speed_multiplier, jumps, score):
+        self.seed = seed
+        self.speed_multiplier = speed_multiplier
+        self.jumps = list(jumps)  # tick indices, ascending
+        self.score = score
+
+    def to_bytes(self):
+        out = bytearray(HEADER.pack(MAGIC, REPLAY_VERSION, self.seed, self.speed_multiplier, self.score, len(self.jumps)))
+        previous = 0
+        for tick in self.jumps:
+            delta = tick - previous
+            previous = tick
+            while delta >= 0x80:
+                out.append(delta & 0x7F | 0x80)
+                delta >>= 7
+            out.append(delta)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < HEADER.size:
+            raise ReplayError('replay is truncated')
+        magic, version, seed, speed_multiplier, score, count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ReplayError('not a Skyward Dash replay')
+        if version != REPLAY_VERSION:
+            raise ReplayError(f'replay format version {version} is not supported')
+        jumps = []
+        tick = 0
+        pos = HEADER.size
+        for _ in range(count):
+            delta = shift = 0
+            while True:
+                if pos >= len(data):
+                    raise ReplayError('replay is truncated')
+                byte = data[pos]
+                pos += 1
+                delta |= (byte & 0x7F) << shift
+                shift += 7
+                if byte < 0x80:
+                    break
+            tick += delta
+            jumps.append(tick)
+        return cls(seed, speed_multiplier, jumps, score)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+_game = None  # headless game reused by every replay played in this process
+
+
+def play(replay, game=None):
+    """
+    Re-simulates a replay headlessly, as fast as possible, and returns the final state.
+    """
+    global _game
+    if game is None:
+        if _game is None:
+            from .game import SkywardDashGame
+            _game = SkywardDashGame(headless=True)
+        game = _game
+
+    jumps = set(replay.jumps)
+    state = game.reset(replay.seed, replay.speed_multiplier)
+    done = False
+    while not done:
+        state, done = game.step(state['tick'] in jumps)
+    return state
+
+
+def verify(replay, game=None):
+    """
+    True when re-simulating the replay reaches the score it claims.
+    """
+    return play(replay, game)['score'] == replay.score
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Verify Skyward Dash replays by re-simulating them.')
+    parser.add_argument('command', choices=['verify'])
+    parser.add_argument('paths', nargs='+')
+    args = parser.parse_args()
+
+    failures = 0
+    for path in args.paths:
+        try:
+            replay = Replay.load(path)
+        except (OSError, ReplayError) as error:
+            print(f'{path}: ERROR {error}')
+            failures += 1
+            continue
+        start = time.perf_counter()
+        state = play(replay)
+        elapsed = time.perf_counter() - start
+        ok = state['score'] == replay.score
+        failures += not ok
+        print(f"{path}: {'OK' if ok else 'MISMATCH'} claimed {replay.score}, simulated {state['score']} "
+              f"({state['tick'] / elapsed:.0f} ticks/s)")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+Persistent Skyward Dash leaderboards in SQLite.
+
+Every finished run is one row, keyed by the level it was played on. A level is played
+at its own speed multiplier, so that number is both the level and the mode of a
+leaderboard. Reads of the best score come from an in-memory cache; top-N queries use
+the (speed_multiplier, score) index. Writes are queued and committed by a background
+thread, so recording a score never blocks the frame loop.
+
+    python -m skyward_dash.scores top --speed 2 -n 10
+"""
+import argparse
+import queue
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    speed_multiplier INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    seed TEXT,  -- hex, as in replay file names
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_level ON scores (speed_multiplier, score DESC);
+"""
+WRITE_ATTEMPTS = 4  # tries per batch before its scores are given up
+WRITE_RETRY_DELAY = 0.5  # seconds before the first retry, doubled after every failure
+
+
+class ScoreStore:
+    def __init__(self, path):
+        """
+        Returns at once: the database is opened, set up and read by the writer thread.
+        """
+        self.path = path
+        self.best = {}  # best score of every level, read by menus without touching the database
+        self.available = True  # cleared when the database cannot be opened, scores then stay in memory
+        self.ready = threading.Event()  # set once the writer has opened the database, or given up
+        self.pending = queue.Queue()
+        self.writer = threading.Thread(target=self.write_loop, daemon=True)
+        self.writer.start()
+
+    def connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')  # readers on other connections never wait for the writer
+        return conn
+
+    def add(self, score, speed_multiplier, seed=None):
+        """
+        Records a finished run. Returns at once, the row is written by the background thread.
+        """
+        if score > self.best.get(speed_multiplier, 0):
+            self.best[speed_multiplier] = score
+        if not self.available:
+            return
+        seed = None if seed is None else f'{seed:016x}'  # 64-bit seeds do not fit SQLite integers
+        self.pending.put((speed_multiplier, score, seed, time.time()))
+
+    def high_score(self, speed_multiplier):
+        return self.best.get(speed_multiplier, 0)
+
+    def top(self, speed_multiplier, n=10):
+        """
+        The n best (score, seed, created) rows of a level, best first.
+        """
+        self.ready.wait()
+        conn = self.connect()
+        try:
+            return conn.execute(
+                'SELECT score, seed, created FROM scores WHERE speed_multiplier = ? ORDER BY score DESC LIMIT ?',
+                (speed_multiplier, n)).fetchall()
+        finally:
+            conn.close()
+
+    def open(self):
+        """
+        Writer-thread setup: creates the schema and loads the best score of every level.
+        """
+        try:
+            conn = self.open_connection()
+            for speed_multiplier, score in conn.execute('SELECT speed_multiplier, MAX(score) FROM scores GROUP BY speed_multiplier'):
+                if score > self.best.get(speed_multiplier, 0):  # a run may have been added meanwhile
+                    self.best[speed_multiplier] = score
+            return conn
+        except sqlite3.Error as error:
+            print(f"Warning: high scores cannot be saved to {self.path} and are kept in memory only: {error}")
+            self.available = False
+            return None
+        finally:
+            self.ready.set()
+
+    def open_connection(self):
+        conn = self.connect()
+        try:
+            conn.executescript(SCHEMA)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def write_loop(self):
+        conn = self.open()
+        while True:
+            rows = [self.pending.get()]
+            while True:  # everything queued meanwhile goes into the same transaction
+                try:
+                    rows.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            closing = None in rows
+            rows = [row for row in rows if row is not None]
+            try:
+                if rows and self.available:
+                    conn = self.write(conn, rows)
+            finally:  # flush() and close() must never wait on a batch that failed
+                for _ in range(len(rows) + closing):
+                    self.pending.task_done()
+            if closing:
+                if conn is not None:
+                    conn.close()
+                return
+
+    def write(self, conn, rows):
+        """
+        Commits rows, retrying when the database is locked or unwritable for a while.
+        Returns the connection to use for the next batch.
+        """
+        for attempt in range(WRITE_ATTEMPTS):
+            try:
+                if conn is None:
+                    conn = self.open_connection()
+                with conn:
+                    conn.executemany('INSERT INTO scores (speed_multiplier, score, seed, created) VALUES (?, ?, ?, ?)', rows)
+                return conn
+            except sqlite3.Error as error:
+                if conn is not None:
+                    conn.close()
+                    conn = None
+                if attempt + 1 == WRITE_ATTEMPTS:
+                    print(f"Warning: could not save {len(rows)} score(s) to {self.path}: {error}")
+                else:
+                    time.sleep(WRITE_RETRY_DELAY * 2 ** attempt)
+        return conn
+
+    def flush(self):
+        """
+        Blocks until every queued score is committed.
+        """
+        self.pending.join()
+
+    def close(self):
+        if self.writer.is_alive():
+            self.pending.put(None)
+            self.writer.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Show Skyward Dash leaderboards.')
+    parser.add_argument('command', choices=['top'])
+    parser.add_argument('--db', default='scores.db')
+    parser.add_argument('--speed', type=int, default=1, help='level, i.e. speed multiplier')
+    parser.add_argument('-n', type=int, default=10)
+    args = parser.parse_args()
+
+    store = ScoreStore(args.db)
+    for rank, (score, seed, created) in enumerate(store.top(args.speed, args.n), 1):
+        print(f'{rank:3}  {score:8}  {time.strftime("%Y-%m-%d %H:%M", time.localtime(created))}  {seed or ""}')
+    store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+Batch runner for headless Skyward Dash simulations.
+
+Spreads seeded runs over a process pool, each one driven by an input policy, and
+collects per-run stats. Class constants such as GAP_SIZE, OBSTACLE_INTERVAL or
+LEVEL_UP_SCORE can be overridden per batch for balance tuning:
+
+    python -m skyward_dash.simulate --runs 10000 --policy heuristic --set GAP_SIZE=200
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from .game import SkywardDashGame
+
+_games = {}  # headless games of this worker process by entity_store, so assets load only once
+
+
+def get_game(entity_store=False):
+    game = _games.get(entity_store)
+    if game is None:
+        game = _games[entity_store] = SkywardDashGame(headless=True, entity_store=entity_store)
+    return game
+
+
+def idle_policy(game, rng):
+    return False
+
+
+def random_policy(game, rng):
+    return rng.random() < 0.1
+
+
+def heuristic_policy(game, rng):
+    """
+    Flaps whenever the bird falls below the centre of the next gap.
+    """
+    bird = game.bird
+    gap = game.next_gap()
+    target = gap[1] if gap else game.SCREEN_HEIGHT // 2
+    return bird.rect.centery > target + 20 and bird.velocity >= 0
+
+
+POLICIES = {
+    'idle': idle_policy,
+    'random': random_policy,
+    'heuristic': heuristic_policy,
+}
+
+
+def run_one(seed, speed_multiplier=1, policy='heuristic', jumps=None, max_ticks=100000, overrides=None,
+            entity_store=False):
+    """
+    Plays one seeded run and returns its stats.
+    jumps is an optional collection of tick indices to jump on, which replaces the policy.
+    """
+    game = get_game(entity_store)
+    # drop overrides left behind by a previous run in this worker
+    for name in [name for name in vars(game) if name.isupper()]:
+        delattr(game, name)
+    for name, value in (overrides or {}).items():
+        setattr(game, name, value)
+
+    choose = POLICIES[policy]
+    policy_rng = random.Random(seed)
+    jumps = set(jumps) if jumps is not None else None
+
+    state = game.reset(seed, speed_multiplier)
+    done = False
+    while not done and game.tick_count < max_ticks:
+        if jumps is not None:
+            action = game.tick_count in jumps
+        else:
+            action = choose(game, policy_rng)
+        state, done = game.step(action)
+
+    return {
+        'seed': seed,
+        'score': state['score'],
+        'death_tick': state['tick'] if state['crashed'] else None,
+        'powerups_collected': state['powerups_collected'],
+        'ticks': state['tick'],
+    }
+
+
+def run_batch(runs, first_seed=0, workers=None, **kwargs):
+    """
+    Runs seeds first_seed .. first_seed + runs - 1 across all cores.
+    Keyword arguments are passed on to run_one.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, runs // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(partial(run_one, **kwargs), range(first_seed, first_seed + runs), chunksize=chunksize))
+
+
+def summarize(results):
+    scores = [result['score'] for result in results]
+    deaths = [result['death_tick'] for result in results if result['death_tick'] is not None]
+    return {
+        'runs': len(results),
+        'ticks': sum(result['ticks'] for result in results),
+        'mean_score': statistics.fmean(scores) if scores else 0,
+        'median_score': statistics.median(scores) if scores else 0,
+        'max_score': max(scores, default=0),
+        'death_rate': len(deaths) / len(results) if results else 0,
+        'mean_powerups': statistics.fmean(result['powerups_collected'] for result in results) if results else 0,
+    }
+
+
+def parse_override(text):
+    name, _, value = text.partition('=')
+    return name.strip(), json.loads(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run headless Skyward Dash simulations in parallel.')
+    parser.add_argument('--runs', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0, help='first seed of the batch')
+    parser.add_argument('--speed', type=int, default=1, help='speed multiplier (level)')
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='heuristic')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-ticks', type=int, default=100000)
+    parser.add_argument('--set', dest='overrides', action='append', type=parse_override, default=[],
+                        metavar='NAME=VALUE', help='override a game constant, e.g. GAP_SIZE=200')
+    parser.add_argument('--entity-store', action='store_true', help='simulate with the NumPy entity store')
+    parser.add_argument('--output', help='write per-run results to this JSON file')
+    args = parser.parse_args()
+
+    results = run_batch(args.runs, args.seed, args.workers, speed_multiplier=args.speed, policy=args.policy,
+                        max_ticks=args.max_ticks, overrides=dict(args.overrides),
+                        entity_store=args.entity_store)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f)
+    print(json.dumps(summarize(results), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+import itertools
+import os
+
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import random
+
+import pygame
+
+from skyward_dash import level
+from skyward_dash.game import SkywardDashGame
+
+TICKS = 20000
+
+
+@pytest.mark.parametrize('obstacle_interval, scroll_speed, speed_multiplier', [
+    (1500, 5, 1),
+    (1500, 2, 1),
+    (500, 5, 1),
+    (500, 5, 3),
+    (3000, 1, 2),
+])
+def test_every_pillar_pair_is_spawned(obstacle_interval, scroll_speed, speed_multiplier):
+    class Game(SkywardDashGame):
+        OBSTACLE_INTERVAL = obstacle_interval
+        SCROLL_SPEED = scroll_speed
+
+    game = Game(headless=True)
+    game.powerup_image = pygame.Surface((30, 30))  # only its size is used, no need to load the assets
+    generator = level.LevelGenerator(game, random.Random(1), speed_multiplier)
+    events = list(itertools.takewhile(lambda event: event[0] < TICKS, generator.events()))
+    pillars = [tick for tick, kind, _ in events if kind == level.OBSTACLE]
+    assert pillars == list(range(generator.obstacle_ticks, TICKS, generator.obstacle_ticks))
+    assert [tick for tick, _, _ in events] == sorted(tick for tick, _, _ in events)